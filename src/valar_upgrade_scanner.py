@@ -30,6 +30,7 @@ For each *Valar validator contract* (a.k.a. "validator ad"):
 Data sources
 ------------
   • Local algod (no database): reads Noticeboard-created apps and each app’s global state
+      (bulk: one account read per creator returns the global state of all its apps)
   • Indexer: reads block headers for proposers in the voting window
 
 Rules & definitions
@@ -52,7 +53,14 @@ Environment (set in shell)
   INDEXER_URL     (e.g., https://mainnet-idx.4160.nodely.dev)  [required]
   NOTICEBOARD_APP_ID   (optional override, default set below)
   TIMEOUT_S       (optional, default 8.0)
-  MAX_WORKERS     (optional, default 12)
+  ALGOD_WORKERS   (optional, default 32; concurrent algod reads)
+  INDEXER_WORKERS (optional, default 8; concurrent Indexer requests)
+  MAX_WORKERS     (optional, legacy; default for both of the above when set)
+  INDEXER_RPS     (optional, default 20; Indexer requests/second, 0 = unpaced)
+  SORT_OUTPUT     (optional, default 1; 0 streams main-section rows unsorted
+                   as each validator is resolved)
+  CACHE_PATH      (optional, e.g. /tmp/valar-cache; on-disk cache of decoded
+                   validator state, reused by re-runs in the same voting window)
 
 Noticeboard
 -----------
@@ -75,20 +83,33 @@ Limitations / Notes
     vote-window headers only.
   • Pre-switch vs post-switch behavior differs; this tool focuses on *pre-switch*
     voting window classification.
-  • Be mindful of Indexer rate limits; adjust MAX_WORKERS and TIMEOUT_S accordingly.
+  • Be mindful of Indexer rate limits; adjust INDEXER_RPS, INDEXER_WORKERS and TIMEOUT_S accordingly.
 """
 
 import os
 import sys
 import csv
 import base64
+import shelve
+import struct
+import threading
+import time
 import requests
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote, urlencode
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from algosdk import constants, error
 from algosdk.v2client import algod
 from algosdk.encoding import encode_address
 from algosdk.logic import get_application_address
 
+try:  # optional: orjson parses Indexer pages 2-4x faster, straight from bytes
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # ---------------------------
 # Public constant + env override
 # ---------------------------
@@ -102,7 +123,23 @@ INDEXER_URL   = os.getenv("INDEXER_URL", "")  # required for header scans
 
 # Tuning knobs
 TIMEOUT_S   = float(os.getenv("TIMEOUT_S", "8.0"))
-MAX_WORKERS = int(os.getenv("MAX_WORKERS", "12"))
+# algod (usually local) and Indexer (usually a rate-limited provider) get
+# independent concurrency; MAX_WORKERS is still honored as a shared default.
+ALGOD_WORKERS   = int(os.getenv("ALGOD_WORKERS")   or os.getenv("MAX_WORKERS") or "32")
+INDEXER_WORKERS = int(os.getenv("INDEXER_WORKERS") or os.getenv("MAX_WORKERS") or "8")
+INDEXER_RPS = float(os.getenv("INDEXER_RPS", "20"))
+CACHE_PATH  = os.getenv("CACHE_PATH", "")  # empty → no on-disk cache
+PROPOSER_CHUNK = 50  # proposer addresses per block-headers query (keeps URLs short)
+SORT_OUTPUT = os.getenv("SORT_OUTPUT", "1") != "0"  # 0 → stream rows as resolved
+TAIL_ROUNDS = 1_000  # window tail scanned first; active proposers resolve there
+
+CSV_HEADER = [
+    "validator_owner","validator_ad_app_id","status","delegators",
+    "total_yes","total_no","total_none","last_in_window_round","validator_state"
+]
+
+# Delegator contract fields read by the scanner: (round_start, round_end, beneficiary)
+DelegatorFields = Tuple[Optional[int], Optional[int], Optional[str]]
 
 # Validator state enum → label (from Valar smart-contract constants)
 STATE_LABEL = {
@@ -116,27 +153,120 @@ STATE_LABEL = {
     0x07: "NOT_LIVE",
 }
 
-# Reuse one Requests session for Indexer
+# States in which an ad cannot have delegator contracts (it has not been set
+# up yet), so it cannot have window-active delegators: listed as zero rows
+# without reading any delegator. Every other state may still serve delegators
+# that were active in the window (NOT_READY / NOT_LIVE ads stop taking new
+# delegators but keep serving existing contracts), so those are scanned.
+NO_DELEGATOR_STATES = frozenset({0x00, 0x01})
+
+# Reuse one Requests session for Indexer; size its pool for concurrent scans
+# (urllib3 otherwise keeps only 10 connections per host). Rate-limit (429) and
+# gateway errors are retried in indexer_get(), not by the adapter, so that every
+# retry is paced by INDEXER_LIMITER too.
 S = requests.Session()
+S.mount("http://",  HTTPAdapter(pool_connections=64, pool_maxsize=64))
+S.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+
+# Separate pooled session for algod: every algod worker can hold a connection
+# at once, and connections are kept alive between calls.
+S_ALGOD = requests.Session()
+S_ALGOD.mount("http://",  HTTPAdapter(pool_connections=4, pool_maxsize=ALGOD_WORKERS))
+S_ALGOD.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=ALGOD_WORKERS))
 
 # ---------------------------
 # algod client
 # ---------------------------
+class SessionAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient that sends requests over the pooled S_ALGOD session. The SDK's
+    own algod_request opens a fresh urllib connection for every call.
+    """
+    def algod_request(self, method, requrl, params=None, data=None, headers=None,
+                      response_format="json", timeout=30):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = algod.api_version_path_prefix + requrl
+
+        r = S_ALGOD.request(method, self.algod_address + requrl, params=params, data=data,
+                            headers=header, timeout=timeout)
+        if r.status_code >= 400:
+            # Same error surface as the SDK: message from the JSON body if present
+            try:
+                j = r.json()
+                msg = j.get("message", r.text)
+            except ValueError:
+                j, msg = {}, r.text
+            raise error.AlgodHTTPError(msg, r.status_code, j.get("data"))
+        if response_format == "json":
+            return r.json() if r.content else {}
+        return r.content
+
 def build_algod() -> algod.AlgodClient:
     # If the node requires a token and ALGOD_TOKEN is empty, requests will 401.
-    return algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+    return SessionAlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
 
 # ---------------------------
 # Global state decoding helpers
 # ---------------------------
-def _u64(b: bytes, ofs: int = 0) -> int:
-    return int.from_bytes(b[ofs:ofs+8], "big")
-
 def _decode_u64_list(b: bytes) -> List[int]:
-    # Valar packs arrays (P/T/W/S/del_app_list) as big-endian u64 slices.
-    return [_u64(b, i) for i in range(0, len(b), 8) if i + 8 <= len(b)]
+    # Valar packs arrays (P/T/W/S/del_app_list) as big-endian u64 slices
+    # (a trailing partial slice is ignored).
+    n = len(b) // 8
+    return list(struct.unpack(f">{n}Q", b[: n * 8]))  # one C-level pass
+
+# Value decoders take the base64 string exactly as algod returns it.
+@lru_cache(maxsize=1 << 16)
+def _addr_from_b64(b: str) -> object:
+    # Many delegators share a beneficiary (and manager): repeats skip both the
+    # base64 decode and encode_address's checksum hash.
+    raw = base64.b64decode(b)
+    if len(raw) != 32:
+        return raw.hex()
+    try:
+        return encode_address(raw)
+    except Exception:
+        return raw.hex()
+
+def _u64_list_from_b64(b: str) -> List[int]:
+    return _decode_u64_list(base64.b64decode(b))
+
+def _state_from_b64(b: str) -> object:
+    raw = base64.b64decode(b)
+    return raw[0] if raw else raw.hex()  # single-byte enum
+
+def _hex_from_b64(b: str) -> str:
+    return base64.b64decode(b).hex()
+
+def _b64key(k: str) -> str:
+    return base64.b64encode(k.encode()).decode()
+
+# Every key the scanner reads, indexed by its base64 form as algod returns it, so
+# decode_gs resolves both name and decoder with one dict lookup instead of
+# decoding every key. Byte values of uint keys (round_start/round_end) fall back to hex.
+_DECODERS: Dict[str, Tuple[str, Callable[[str], object]]] = {
+    **{_b64key(k): (k, _addr_from_b64) for k in ("val_owner", "val_manager", "del_beneficiary", "del_manager")},
+    **{_b64key(k): (k, _u64_list_from_b64) for k in ("P", "T", "W", "S", "del_app_list")},
+    **{_b64key(k): (k, _hex_from_b64) for k in ("round_start", "round_end")},
+    _b64key("state"): ("state", _state_from_b64),
+}
 
-def decode_gs(gs) -> Dict[str, object]:
+@lru_cache(maxsize=4096)
+def _key_name(b64key: str) -> str:
+    # Other keys repeat across every app of the same contract type; decode each once.
+    return base64.b64decode(b64key).decode()
+
+# Keys each reader actually consumes (base64 form, see decode_gs `only`)
+_VALIDATOR_KEYS: FrozenSet[str] = frozenset(_b64key(k) for k in ("val_owner", "del_app_list", "state"))
+_DELEGATOR_KEYS: FrozenSet[str] = frozenset(_b64key(k) for k in ("round_start", "round_end", "del_beneficiary"))
+
+def decode_gs(gs, only: Optional[FrozenSet[str]] = None) -> Dict[str, object]:
     """
     Decode app global-state (as returned by algod) into a dict of Python types:
     - uints as int
@@ -144,112 +274,245 @@ def decode_gs(gs) -> Dict[str, object]:
     - packed lists (P/T/W/S/del_app_list) as u64 arrays
     - single-byte 'state' stored as an int
     - everything else as hex
+    If `only` is given (base64-encoded key names), all other entries are skipped
+    before any decoding.
     """
     out: Dict[str, object] = {}
     for entry in gs or []:
-        key = base64.b64decode(entry["key"]).decode()
+        if only is not None and entry["key"] not in only:
+            continue
+        known = _DECODERS.get(entry["key"])
+        key = known[0] if known else _key_name(entry["key"])
         val = entry["value"]
         if val["type"] == 2:
             out[key] = val["uint"]
         else:
-            raw = base64.b64decode(val["bytes"])
-            if key in ("val_owner", "val_manager", "del_beneficiary", "del_manager") and len(raw) == 32:
-                try:
-                    out[key] = encode_address(raw)
-                except Exception:
-                    out[key] = raw.hex()
-            elif key in ("P", "T", "W", "S", "del_app_list"):
-                out[key] = _decode_u64_list(raw)
-            elif key == "state" and len(raw) >= 1:
-                out[key] = raw[0]  # single-byte enum
-            else:
-                out[key] = raw.hex()
+            out[key] = (known[1] if known else _hex_from_b64)(val["bytes"])
     return out
 
 # ---------------------------
 # On-chain reads (algod)
 # ---------------------------
-def noticeboard_validator_ids(client: algod.AlgodClient, nb_app_id: int) -> List[int]:
+def created_app_states(client: algod.AlgodClient, creator: str) -> Dict[int, list]:
+    """
+    Returns {app_id: global-state} for every app created by `creator`.
+    algod inlines each created app's params in the account record, so this is
+    one round-trip instead of one application_info call per app.
+    """
+    created = client.account_info(creator).get("created-apps", [])
+    return {app["id"]: app.get("params", {}).get("global-state", []) for app in created}
+
+def noticeboard_validator_states(client: algod.AlgodClient, nb_app_id: int) -> Dict[int, list]:
     """
     The Noticeboard escrow address owns (created-apps) all validator ad apps.
+    Returns {validator_ad_app_id: global-state}.
     """
-    nb_escrow = get_application_address(nb_app_id)
-    created = client.account_info(nb_escrow).get("created-apps", [])
-    return [app["id"] for app in created]
+    return created_app_states(client, get_application_address(nb_app_id))
 
-def get_validator_info(client: algod.AlgodClient, vid: int) -> Tuple[str, List[int], int]:
+def get_validator_info(client: algod.AlgodClient, vid: int, gs: Optional[list] = None) -> Tuple[str, List[int], int]:
     """
     Returns (val_owner, delegator_app_ids, validator_state_byte)
     NOTE: val_owner is *not* the proposer; we classify using delegator beneficiaries.
+    Pass a preloaded `gs` to skip the algod read.
     """
-    gs = client.application_info(vid)["params"].get("global-state", [])
-    d  = decode_gs(gs)
+    if gs is None:
+        gs = client.application_info(vid)["params"].get("global-state", [])
+    d  = decode_gs(gs, _VALIDATOR_KEYS)
     owner = str(d.get("val_owner", ""))  # kept for CSV / reference
-    del_list = list(d.get("del_app_list", [])) if isinstance(d.get("del_app_list", []), list) else []
+    raw_list = d.get("del_app_list", [])
+    # del_app_list is a fixed slot array; free slots hold 0 and are not delegators.
+    del_list = [did for did in raw_list if did] if isinstance(raw_list, list) else []
     vstate = int(d.get("state", 0))
     return owner, del_list, vstate
 
-def get_delegator_fields(client: algod.AlgodClient, did: int) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+def get_delegator_fields(client: algod.AlgodClient, did: int, gs: Optional[list] = None) -> DelegatorFields:
     """
     Returns (round_start, round_end, delegator_beneficiary_address)
+    Pass a preloaded `gs` to skip the algod read.
     """
-    gs = client.application_info(did)["params"].get("global-state", [])
-    d  = decode_gs(gs)
-    rs = int(d["round_start"]) if "round_start" in d and d["round_start"] is not None else None
-    re = int(d["round_end"])   if "round_end"   in d and d["round_end"]   is not None else None
-    bene = str(d["del_beneficiary"]) if d.get("del_beneficiary") else None
+    if gs is None:
+        gs = client.application_info(did)["params"].get("global-state", [])
+    d  = decode_gs(gs, _DELEGATOR_KEYS)
+    rs_raw = d.get("round_start")
+    rs = int(rs_raw) if rs_raw is not None else None
+    re_raw = d.get("round_end")
+    re = int(re_raw) if re_raw is not None else None
+    bene = d.get("del_beneficiary") or None  # decode_gs already yields a str
     return rs, re, bene
 
+def _safe_get_delegator_fields(client: algod.AlgodClient, did: int, gs: Optional[list] = None) -> Optional[DelegatorFields]:
+    # A single unreadable delegator must not drop the whole validator; None
+    # marks the read as failed so the caller can skip it (and not cache it).
+    try:
+        return get_delegator_fields(client, did, gs)
+    except Exception:
+        return None
+
+# ---------------------------
+# Indexer rate limiting
+# ---------------------------
+class RateLimiter:
+    """
+    Token bucket shared by all threads: sustains `rate` acquisitions per second
+    with bursts of up to `rate` tokens. A rate <= 0 disables pacing.
+    """
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # Reserve a token now (possibly going into debt) and sleep off the
+            # debt outside the lock, so waiting callers are served in order.
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+INDEXER_LIMITER = RateLimiter(INDEXER_RPS)
+
+INDEXER_RETRIES = 5
+_RETRY_STATUS = frozenset({429, 502, 503, 504})
+
+def _retry_delay(r: requests.Response, attempt: int) -> float:
+    # Honor a numeric Retry-After; otherwise exponential backoff (0.5s, 1s, 2s, ...).
+    try:
+        return max(0.0, float(r.headers.get("Retry-After", "")))
+    except ValueError:
+        return 0.5 * 2 ** attempt
+
 # ---------------------------
 # Indexer reads
 # ---------------------------
+def indexer_get(path: str, params: Optional[dict] = None) -> dict:
+    """
+    GET {INDEXER_URL}{path} on the shared session and return the decoded JSON body.
+    `path` may already carry a query string; `params` are appended to it.
+    Every attempt, retries included, takes a token from INDEXER_LIMITER, so we
+    stay under provider limits and a burst of 429s does not come back as an
+    unpaced retry storm.
+    """
+    for attempt in range(INDEXER_RETRIES + 1):
+        INDEXER_LIMITER.acquire()
+        r = S.get(f"{INDEXER_URL}{path}", params=params, timeout=TIMEOUT_S)
+        if r.status_code not in _RETRY_STATUS or attempt == INDEXER_RETRIES:
+            break
+        time.sleep(_retry_delay(r, attempt))
+    r.raise_for_status()
+    return _json_loads(r.content)
+
 def current_round_indexer() -> int:
     if not INDEXER_URL:
         raise RuntimeError("INDEXER_URL env is required")
-    r = S.get(f"{INDEXER_URL}/v2/transactions", params={"limit": 1}, timeout=TIMEOUT_S)
-    r.raise_for_status()
-    return r.json()["current-round"]
+    return indexer_get("/v2/transactions", {"limit": 1})["current-round"]
 
 def voting_window(cur_round: int) -> Tuple[int, int]:
     """
     Reads a recent header to get upgrade-state.next-protocol-vote-before (V),
     then returns [V-10_000, V] (inclusive).
     """
-    r = S.get(f"{INDEXER_URL}/v2/blocks/{cur_round}", params={"header-only": "true"}, timeout=TIMEOUT_S)
-    r.raise_for_status()
-    blk = (r.json().get("block") or r.json())
+    data = indexer_get(f"/v2/blocks/{cur_round}", {"header-only": "true"})
+    blk = (data.get("block") or data)
     V = int((blk.get("upgrade-state", {}) or {}).get("next-protocol-vote-before") or 0)
     if not V:
         raise RuntimeError("vote-before not available from Indexer header")
     return V - 10_000, V
 
-def last_in_window_for_addrs(addrs: List[str], ws: int, we: int) -> Tuple[Optional[int], Optional[bool]]:
+_EMPTY: dict = {}  # shared read-only fallback for headers without an upgrade-vote
+
+def _scan_headers(addrs: List[str], lo: int, hi: int, last: Dict[str, Tuple[int, bool]]) -> None:
     """
-    Single batched scan for all proposer addresses in [ws, we].
-    Returns (last_round, last_approve) where "last" is the highest round found.
+    Forward-paginated block-headers scan of [lo, hi] for `addrs`; records each
+    proposer's highest (round, approve) into `last`.
     """
-    if not addrs:
-        return None, None
+    # Encode the (long) proposer list once; pages only differ by the next token.
+    base = "/v2/block-headers?" + urlencode(
+        {"proposers": ",".join(addrs), "min-round": lo, "max-round": hi, "limit": 1000}, safe=",")
+    n = len(addrs)
     next_tok = ""
-    last_round: Optional[int] = None
-    last_approve: Optional[bool] = None
-    params = {"proposers": ",".join(addrs), "min-round": ws, "max-round": we, "limit": 1000}
     while True:
-        if next_tok:
-            params["next"] = next_tok
-        r = S.get(f"{INDEXER_URL}/v2/block-headers", params=params, timeout=TIMEOUT_S)
-        r.raise_for_status()
-        data = r.json()
-        for h in data.get("blocks", []):
-            rnd = int(h["round"])
-            appr = (h.get("upgrade-vote", {}) or {}).get("upgrade-approve") is True
-            # Ascending order: overwrite to keep the last (highest) round.
-            last_round = rnd
-            last_approve = appr
+        data = indexer_get(base + "&next=" + quote(next_tok, safe="") if next_tok else base)
+        blocks = data.get("blocks") or ()
+        # Pages are ascending, so only each proposer's last row on the page matters
+        # (later pages overwrite). Walk it backwards and stop once all are seen.
+        seen: set = set()
+        for h in reversed(blocks):
+            a = h["proposer"]
+            if a in seen:
+                continue
+            seen.add(a)
+            uv = h.get("upgrade-vote") or _EMPTY
+            last[a] = (int(h["round"]), uv.get("upgrade-approve") is True)
+            if len(seen) == n:
+                break
         next_tok = data.get("next-token", "")
         if not next_tok:
             break
-    return last_round, last_approve
+
+def last_in_window_by_addr(addrs: List[str], ws: int, we: int) -> Dict[str, Tuple[int, bool]]:
+    """
+    Batched scan for a group of proposer addresses in [ws, we].
+    Returns {proposer: (last_round, last_approve)} for every address with at least
+    one in-window header, where "last" is that proposer's highest round.
+
+    Indexer only pages block headers in ascending order, so rather than walking
+    every in-window header we scan the last TAIL_ROUNDS first: any address seen
+    there is final. Only the addresses still unresolved are scanned over the rest
+    of the window, which keeps busy proposers from dragging in pages of older rows.
+    """
+    if not addrs:
+        return {}
+    last: Dict[str, Tuple[int, bool]] = {}
+    tail_lo = max(ws, we - TAIL_ROUNDS + 1)
+    _scan_headers(addrs, tail_lo, we, last)
+    pending = [a for a in addrs if a not in last]
+    if pending and tail_lo > ws:
+        _scan_headers(pending, ws, tail_lo - 1, last)
+    return last
+
+# ---------------------------
+# On-disk state cache
+# ---------------------------
+class StateCache:
+    """
+    Optional shelve-backed cache of decoded per-validator state (and, once the
+    window has closed, each proposer's last in-window header) for one voting
+    window. Every entry is dropped when the window changes or the current round
+    crosses its end, so a closed window never reuses state read while it was open.
+    A falsy path disables the cache (get() always misses).
+    """
+    def __init__(self, path: str, ws: int, we: int, cur: int):
+        self._lock = threading.Lock()
+        self._db = shelve.open(path) if path else None
+        if self._db is not None:
+            tag = f"{ws}:{we}:{'closed' if cur > we else 'open'}"
+            if self._db.get("__window__") != tag:
+                self._db.clear()
+                self._db["__window__"] = tag
+
+    def get(self, key: str):
+        if self._db is None:
+            return None
+        with self._lock:
+            return self._db.get(key)
+
+    def put(self, key: str, value) -> None:
+        if self._db is None:
+            return
+        with self._lock:
+            self._db[key] = value
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
 
 # ---------------------------
 # Core logic
@@ -285,40 +548,124 @@ def main():
     ws, we = voting_window(cur)
     print(f"# VOTING_WINDOW [{ws},{we}]  (inclusive)")
 
-    # Discover all validator ads from the Noticeboard escrow
-    vids = noticeboard_validator_ids(client, NOTICEBOARD_APP_ID)
+    # Discover all validator ads (and their global state) from the Noticeboard escrow
+    gs_map = noticeboard_validator_states(client, NOTICEBOARD_APP_ID)
+    vids = list(gs_map)
+    cache = StateCache(CACHE_PATH, ws, we, cur)
 
     main_rows: List[List[str]] = []
     zero_rows: List[List[str]] = []
 
-    def work(vid: int):
+    def load(vid: int) -> Optional[Tuple[str, str, List[int], Dict[int, Optional[DelegatorFields]], bool]]:
         """
-        Per-validator worker:
-          1) read validator state (val_owner, del_app_list, validator_state)
-          2) collect proposers = delegator beneficiaries ACTIVE IN WINDOW
-          3) scan Indexer headers in [ws, we] across those proposers
-          4) “last block wins” classification
+        Per-validator algod read:
+          1) decode validator state (val_owner, del_app_list, validator_state)
+          2) bulk-load its delegators' fields from the validator escrow
+        Returns (owner, validator_state_label, delegator_ids, {did: fields}, bulk_ok),
+        or None if unreadable. Delegators missing from the bulk read are left out;
+        bulk_ok is False if the escrow read itself failed.
         """
         try:
-            owner, delids, vstate = get_validator_info(client, vid)
+            owner, delids, vstate = get_validator_info(client, vid, gs_map[vid])
             vstate_label = STATE_LABEL.get(int(vstate), f"UNKNOWN_STATE_{vstate}")
+            # delids already excludes free (0) slots, so an ad whose slots are all
+            # empty lands here too and its escrow is never read.
+            if vstate in NO_DELEGATOR_STATES or not delids:
+                return owner, vstate_label, [], {}, True
+
+            # Delegator contracts are created by the validator ad, so one account read
+            # on its escrow returns their global state in bulk. Anything missing from
+            # it (or everything, if that read fails) falls back to per-app reads.
+            bulk_ok = True
+            try:
+                dgs = created_app_states(client, get_application_address(vid))
+            except Exception:
+                dgs, bulk_ok = {}, False
+            fields = {did: _safe_get_delegator_fields(client, did, dgs[did]) for did in delids if did in dgs}
+            return owner, vstate_label, delids, fields, bulk_ok
+        except Exception:
+            return None
+
+    def scan(chunk: List[str]) -> Tuple[List[str], Optional[Dict[str, Tuple[int, bool]]]]:
+        try:
+            return chunk, last_in_window_by_addr(chunk, ws, we)
+        except Exception:
+            return chunk, None
+
+    # Phase 1 (algod): proposers per validator = delegator beneficiaries ACTIVE IN
+    # WINDOW. Validator reads and the per-app fallback reads are queued flat on one
+    # pool (no task waits on another, so the pool cannot deadlock on itself).
+    # Cached entries are keyed on the validator's current (owner, del_app_list,
+    # state), decoded fresh from gs_map every run, so a delegator added (or a
+    # state change) after the entry was written forces a re-read.
+    def fingerprint(vid: int) -> Optional[Tuple[str, List[int], int]]:
+        try:
+            return get_validator_info(client, vid, gs_map[vid])
+        except Exception:
+            return None
+
+    collected: Dict[int, Optional[Tuple[str, List[str], str]]] = {}
+    current = {vid: fingerprint(vid) for vid in vids}
+    for vid in vids:
+        hit = cache.get(str(vid))
+        if hit is not None and current[vid] is not None and hit[0] == current[vid]:
+            collected[vid] = hit[1]
+    todo = [vid for vid in vids if vid not in collected]
+    with ThreadPoolExecutor(max_workers=ALGOD_WORKERS) as algod_pool:
+        loaded = dict(zip(todo, algod_pool.map(load, todo)))
+        missing = [did for l in loaded.values() if l is not None for did in l[2] if did not in l[3]]
+        fallback = dict(zip(missing, algod_pool.map(lambda d: _safe_get_delegator_fields(client, d), missing)))
+    for vid, l in loaded.items():
+        if l is None:
+            collected[vid] = None
+            continue
+        owner, vstate_label, delids, fields, complete = l
+        # Build proposer set only from delegators whose life overlaps the window
+        proposers: List[str] = []
+        for did in delids:
+            f = fields[did] if did in fields else fallback[did]
+            if f is None:
+                complete = False  # unreadable delegator: skipped for this run only
+                continue
+            rs, re, bene = f
+            if bene and overlaps_window(rs, re, ws, we):
+                proposers.append(bene)
+        collected[vid] = (owner, proposers, vstate_label)
+        # Only cache complete reads; anything that hit an algod error is re-read
+        # next run, like an unreadable validator (None) is.
+        if complete and current[vid] is not None:
+            cache.put(str(vid), (current[vid], collected[vid]))
+
+    # CSV output: main rows stream as each validator is resolved unless SORT_OUTPUT
+    # is set (default), in which case they are buffered for stable ordering.
+    w = csv.writer(sys.stdout, lineterminator="\n")
+    w.writerow(CSV_HEADER)
+
+    # Global memo: proposer → its last in-window (round, approve), or None if it
+    # has no in-window header. Each address is resolved once, however many
+    # validators share it.
+    addr_last: Dict[str, Optional[Tuple[int, bool]]] = {}
+    failed: set = set()
 
-            # Build proposer set only from delegators whose life overlaps the window
-            proposers: List[str] = []
-            for did in delids:
-                try:
-                    rs, re, bene = get_delegator_fields(client, did)
-                    if bene and overlaps_window(rs, re, ws, we):
-                        proposers.append(bene)
-                except Exception:
-                    continue
-
-            if not proposers:
-                # Not eligible to vote in the window → list separately
-                return ("ZERO", [owner, str(vid), "UNKNOWN", "0", "0", "0", "0", "", vstate_label])
-
-            # Single batched Indexer query: last header across all proposers
-            last_round, last_approve = last_in_window_for_addrs(proposers, ws, we)
+    def emit(vid: int) -> None:
+        """
+        “Last block wins” classification for one validator, once all of its
+        proposers have been scanned.
+        """
+        c = collected[vid]
+        if c is None or any(a in failed for a in c[1]):
+            # Conservative fallback
+            row = ["", str(vid), "UNKNOWN", "0", "0", "0", "0", "", "UNKNOWN_STATE"]
+        elif not c[1]:
+            # Not eligible to vote in the window → list separately
+            zero_rows.append([c[0], str(vid), "UNKNOWN", "0", "0", "0", "0", "", c[2]])
+            return
+        else:
+            owner, proposers, vstate_label = c
+
+            # Last header across all of this validator's proposers
+            hits = [addr_last[a] for a in proposers if addr_last.get(a)]
+            last_round, last_approve = max(hits) if hits else (None, None)
             had_any = (last_round is not None)
             status = classify(last_approve, had_any)
 
@@ -329,37 +676,65 @@ def main():
 
             row = [owner, str(vid), status, str(len(proposers)), total_yes, total_no, total_none,
                    (str(last_round) if had_any else ""), vstate_label]
-            return ("MAIN", row)
-
-        except Exception:
-            # Conservative fallback
-            return ("MAIN", ["", str(vid), "UNKNOWN", "0", "0", "0", "0", "", "UNKNOWN_STATE"])
-
-    # Parallelize across validators (Indexers typically handle this load, but tune MAX_WORKERS if needed)
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        futs = [ex.submit(work, vid) for vid in vids]
-        for f in as_completed(futs):
-            kind, row = f.result()
-            (main_rows if kind == "MAIN" else zero_rows).append(row)
-
-    # Stable ordering for CSV review
-    main_rows.sort(key=lambda r: (r[0], int(r[1]) if r[1].isdigit() else 0))
+        if SORT_OUTPUT:
+            main_rows.append(row)
+        else:
+            w.writerow(row)
+            sys.stdout.flush()
+
+    # Phase 2 (Indexer): the window is shared, so scan the union of all proposers
+    # once instead of once per validator, in parallel address chunks. Each
+    # validator is classified as soon as the last chunk it depends on finishes.
+    # Once the window has closed its headers can no longer change, so resolved
+    # addresses are also kept in the on-disk cache and skipped on re-runs.
+    closed = cur > we
+    proposers_by_vid = {vid: c[1] for vid, c in collected.items() if c is not None}
+    all_addrs = sorted(set().union(*proposers_by_vid.values()))
+    if closed:
+        for a in all_addrs:
+            hit = cache.get(f"addr:{a}")
+            if hit is not None:
+                addr_last[a] = hit[0]
+    to_scan = [a for a in all_addrs if a not in addr_last]
+    chunks = [to_scan[i:i + PROPOSER_CHUNK] for i in range(0, len(to_scan), PROPOSER_CHUNK)]
+    chunk_of = {a: i // PROPOSER_CHUNK for i, a in enumerate(to_scan)}
+    waiting = {vid: {chunk_of[a] for a in props if a in chunk_of} for vid, props in proposers_by_vid.items()}
+    vids_of: Dict[int, List[int]] = {}
+    for vid, pending in waiting.items():
+        for ci in pending:
+            vids_of.setdefault(ci, []).append(vid)
+
+    for vid in vids:
+        if not waiting.get(vid):
+            emit(vid)  # nothing to scan (unreadable, no window-active delegators, or cached)
+    try:
+        with ThreadPoolExecutor(max_workers=INDEXER_WORKERS) as idx_pool:
+            futs = {idx_pool.submit(scan, chunk): ci for ci, chunk in enumerate(chunks)}
+            for f in as_completed(futs):
+                chunk, found = f.result()
+                if found is None:
+                    failed.update(chunk)
+                else:
+                    for a in chunk:
+                        addr_last[a] = found.get(a)
+                        if closed:
+                            cache.put(f"addr:{a}", (addr_last[a],))
+                for vid in vids_of[futs[f]]:
+                    waiting[vid].discard(futs[f])
+                    if not waiting[vid]:
+                        emit(vid)
+    finally:
+        cache.close()
+
+    # Stable ordering for CSV review (the zero section is buffered in both modes)
+    if SORT_OUTPUT:
+        main_rows.sort(key=lambda r: (r[0], int(r[1]) if r[1].isdigit() else 0))
+        for r in main_rows:
+            w.writerow(r)
     zero_rows.sort(key=lambda r: (r[0], int(r[1]) if r[1].isdigit() else 0))
 
-    # CSV output
-    w = csv.writer(sys.stdout, lineterminator="\n")
-    w.writerow([
-        "validator_owner","validator_ad_app_id","status","delegators",
-        "total_yes","total_no","total_none","last_in_window_round","validator_state"
-    ])
-    for r in main_rows:
-        w.writerow(r)
-
     print("\n# validators_with_no_window_active_delegators")
-    w.writerow([
-        "validator_owner","validator_ad_app_id","status","delegators",
-        "total_yes","total_no","total_none","last_in_window_round","validator_state"
-    ])
+    w.writerow(CSV_HEADER)
     for r in zero_rows:
         w.writerow(r)
 